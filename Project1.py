@@ -1,23 +1,88 @@
+import atexit
 import csv
+from array import array
+from collections import defaultdict
+import io
 import random
 from datetime import datetime
 from abc import ABC, abstractmethod
 import os
 import logging
+import queue
+import re
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 
 # ------- CONFIGURATION  ------- #
 csv_file = "oop_banking.csv"
+journal_file = "oop_banking.journal"
 log_file = "bank_log.txt"
+CSV_COLUMNS = ("account_number", "first_name", "last_name", "gender",
+               "account_type", "balance", "transactions", "checkbook_issued")
+save_interval = 2.0 # seconds between full CSV checkpoints during a session
 
 # ------- LOGGING SET UP  ------- #
-logging.basicConfig(
-    filename = log_file,
-    level = logging.INFO,
-    format = "%(asctime)s - %(levelname)s - %(message)s"
-)
+# Log records go through an in-memory queue to a background listener thread
+# that owns the file handler, so CLI commands never block on disk writes.
+_log_queue = queue.Queue(-1)
+_file_handler = logging.FileHandler(log_file)
+_file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+_log_listener = QueueListener(_log_queue, _file_handler)
+_log_listener.start()
+
+def _stop_log_listener():
+    if _log_listener._thread is not None: # stop() twice would raise
+        _log_listener.stop()
+atexit.register(_stop_log_listener) # flush queued records on exit
+logging.getLogger().addHandler(QueueHandler(_log_queue))
+logging.getLogger().setLevel(logging.INFO)
+
+# Module logger looked up once; hot-path calls are guarded with
+# isEnabledFor and use %-style args so no message string is built when
+# the level is off.
+log = logging.getLogger(__name__)
+_INFO = logging.INFO
+
+# Interned once so every transaction shares one string object per type and
+# equality checks collapse to pointer compares.
+_DEPOSIT = sys.intern("Deposit")
+_WITHDRAWAL = sys.intern("Withdrawal")
+
+# Matches one serialized transaction ("date - type - $amount\nBalance: $bal"),
+# compiled once so loading a large history doesn't re-split every entry.
+_TX_RE = re.compile(r"([^|]+?) - (Deposit|Withdrawal) - \$([\d.]+)\nBalance: \$([\d.]+)")
+
+def _parse_transactions(blob):
+    """Parses a "|"-joined transaction history string into Transaction objects."""
+    fields = _TX_RE.findall(blob)
+    # Local bindings skip the global/attribute lookups on every iteration of
+    # the loops below — it adds up over long histories.
+    _tx = Transaction
+    _float = float
+    _from_iso = datetime.fromisoformat
+    try:
+        # Fast path: one comprehension over the matched fields, no per-entry
+        # exception handling set-up.
+        return [_tx(_float(amount), t_type, _float(balance), _from_iso(date_str))
+                for date_str, t_type, amount, balance in fields]
+    except ValueError:
+        pass
+    # Tolerant path, only reached when some entry is malformed: skip the bad
+    # entries rather than fail the whole load.
+    transactions = []
+    for date_str, t_type, amount, balance in fields:
+        try:
+            transactions.append(_tx(_float(amount), t_type, _float(balance),
+                                    _from_iso(date_str)))
+        except ValueError:
+            pass
+    return transactions
 
 class Transaction:
     """Gives information about an account's transaction history"""
+    __slots__ = ("amount", "type", "date", "current_balance", "_str")
+
     def __init__(self, amount, transaction_type, current_balance, date=None):
         """
         Initializes a transaction.
@@ -29,16 +94,28 @@ class Transaction:
             date (datetime): Timestamp of the transaction. Defaults to now.
         """
         self.amount = amount
-        self.type = transaction_type
+        self.type = sys.intern(transaction_type)
         self.date = date if date else datetime.now()
         self.current_balance = current_balance
+        self._str = None
 
     def __str__(self):
-        return (f"{self.date} - {self.type} - ${self.amount}"
-               f"\nBalance: ${self.current_balance}")
+        # Transactions are immutable once created, so the formatted string
+        # is built once and cached. isoformat() is C-coded and much cheaper
+        # than datetime's default formatting, and fixed two-decimal currency
+        # keeps the fields a predictable width for the parser.
+        if self._str is None:
+            self._str = (f"{self.date.isoformat(timespec='seconds')} - {self.type}"
+                         f" - ${self.amount:.2f}\nBalance: ${self.current_balance:.2f}")
+        return self._str
     
 class BankAccount(ABC):
     """Base class for all bank accounts."""
+    # Fixed attribute slots instead of a per-instance __dict__: smaller
+    # objects and faster attribute access when many accounts are loaded.
+    __slots__ = ("account_number", "first_name", "last_name", "gender",
+                 "account_type", "balance", "_transaction", "_raw_tx",
+                 "_tx_pieces", "_history")
 
     def __init__(self, account_number, first_name, last_name,gender, account_type, balance = 0.0, transaction = None):
         """Initializes a bank account
@@ -57,28 +134,55 @@ class BankAccount(ABC):
         self.gender = gender
         self.account_type = account_type
         self.balance = float(balance)
+        self._raw_tx = None
         self.transaction = transaction if transaction else []
+        # Pre-formatted transaction strings, appended to as transactions
+        # happen, so serializing never re-stringifies the whole history.
+        self._tx_pieces = [str(t) for t in self.transaction]
+        self._history = None
+
+    @property
+    def transaction(self):
+        """The list of Transaction objects, parsed from the saved history
+        string on first access (most accounts in a session are never
+        touched, so their histories are never deserialized)."""
+        if self._transaction is None:
+            self._transaction = _parse_transactions(self._raw_tx or "")
+        return self._transaction
+
+    @transaction.setter
+    def transaction(self, value):
+        self._transaction = value
+
+    def _record(self, tx):
+        """Appends a transaction and its pre-formatted string in one step."""
+        self.transaction.append(tx)
+        self._tx_pieces.append(str(tx))
+        self._history = None # joined history is stale, rebuild on next show
 
     def deposit(self, amount):
         """"A method or function which deposits a specified amount into account and records the transaction"""
-        if amount >= 0:
-            self.balance += amount
-            self.transaction.append(Transaction(amount, "Deposit", self.balance))
-        else: 
+        if amount < 0:
             raise ValueError("Amount must be non-negative!")
+        self.balance += amount
+        self._record(Transaction(amount, _DEPOSIT, self.balance))
 
     def withdraw(self, amount):
-        if amount >= 0:
-            if 0 <= amount <= self.balance:
-                self.balance -= amount
-                self.transaction.append(Transaction(amount, "Withdrawal", self.balance))
-            else: 
-                raise ValueError("Insufficient funds.")
-        else:
-            raise ValueError("Amount must be non-negative!")
+        # One range check covers both the sign and the funds test; only the
+        # (cold) error path works out which message to raise.
+        if not 0 <= amount <= self.balance:
+            raise ValueError("Amount must be non-negative!" if amount < 0
+                             else "Insufficient funds.")
+        self.balance -= amount
+        self._record(Transaction(amount, _WITHDRAWAL, self.balance))
         
     def get_transaction_history(self):
-        return "\n".join(str(t) for t in self.transaction)
+        # _tx_pieces already holds every transaction's formatted string; the
+        # joined result is cached so repeated shows of the same account
+        # don't even pay for the join.
+        if self._history is None:
+            self._history = "\n".join(self._tx_pieces)
+        return self._history
     
     def to_dict(self):
         return{
@@ -88,8 +192,31 @@ class BankAccount(ABC):
             "gender": self.gender,
             "account_type": self.account_type,
             "balance": self.balance,
-            "transactions": "|".join(str(t) for t in self.transaction)
+            "transactions": "|".join(self._tx_pieces)
         }
+
+    def as_row(self):
+        """Returns the account as a tuple in CSV_COLUMNS order (minus the
+        checkbook column, which each subclass appends itself)."""
+        return (self.account_number, self.first_name, self.last_name,
+                self.gender, self.account_type, self.balance,
+                "|".join(self._tx_pieces))
+
+    def apply_delta(self, op, amount, date, new_balance):
+        """Re-applies a journaled mutation without re-running validation.
+
+        Used when replaying the append-only journal on startup, so the
+        transaction keeps its original timestamp and balance.
+        """
+        if op == "deposit":
+            self.balance = new_balance
+            self._record(Transaction(amount, _DEPOSIT, new_balance, date))
+        elif op == "withdraw":
+            self.balance = new_balance
+            self._record(Transaction(amount, _WITHDRAWAL, new_balance, date))
+        elif op == "issue_checkbook":
+            self.checkbook_issued = True
+
     @abstractmethod
     def account_summary(self):
         """Allows sub classes (SavingsAccount and CheckingAccount) to write themselves to specify account type"""
@@ -98,56 +225,67 @@ class BankAccount(ABC):
     @classmethod
     def from_dict(cls, data):
         """Rebuilds a BankAccount(or subclass) from a dictionary loaded from a CSV file row."""
-        transaction = []
-        if data.get("transaction"):
-            for entry in data["transaction"].split("|"):
-                parts = entry.split("-")
-            if len(parts) == 4:
-                try:
-                    date = datetime.fromisoformat(parts[0])
-                    t_type = parts[1]
-                    amount = float(parts[2].replace("$", ""))
-                    balance = float(parts[3].split(": ")[-1])
-                    transaction.append(Transaction(amount, t_type, balance, date))
-                except Exception:
-                    pass
-        
-        account_type = data["account_type"].lower()
+        # Interning collapses the per-row copies of these low-cardinality
+        # fields to one shared string each across the whole CSV.
+        account_type = sys.intern(data["account_type"].lower())
         args = (
             data["account_number"],
             data["first_name"],
             data["last_name"],
-            data["gender"],
+            sys.intern(data["gender"]),
             float(data["balance"]),
-            transaction
+            None # history stays unparsed until the account is used
         )
 
         if account_type == "savings":
-            return SavingsAccount(*args)
+            acc = SavingsAccount(*args)
         elif account_type == "checking":
-            checkbook_issued = data.get("checkbook_issued", "False").lower == "true"
-            return CheckingAccount(*args, checkbook_issued=checkbook_issued)
+            checkbook_issued = data.get("checkbook_issued", "False").lower() == "true"
+            acc = CheckingAccount(*args, checkbook_issued=checkbook_issued)
         else:
             raise ValueError(f"Unknown account type: {account_type}")
 
+        # Keep the raw "|"-joined history; the transaction property parses
+        # it lazily, and the split pieces already serve saving/display.
+        raw = data.get("transactions") or ""
+        acc._raw_tx = raw
+        acc._transaction = None
+        acc._tx_pieces = raw.split("|") if raw else []
+        acc._history = None
+        return acc
+
 # ------- SUBCLASSES  ------- # 
 class SavingsAccount(BankAccount):
     """Savings account with a minimum balance requirement."""
+    __slots__ = ("minimum_balance",)
 
     def __init__ (self, account_number, first_name, last_name, gender, balance=0.0, transactions = None, minimum_balance = 100):
         super().__init__(account_number, first_name, last_name, gender, "savings", balance, transactions)
         self.minimum_balance = minimum_balance
     
     def withdraw(self, amount):
-        if self.balance - amount < self.minimum_balance:
-            raise ValueError(f"Insufficient funds: Cannot go below minimum balance of ${self.minimum_balance} in a savings account.")
+        # Check the minimum-balance floor up front in a single comparison so
+        # nothing is delegated (or recorded) on a doomed withdrawal.
+        new_balance = self.balance - amount
+        if not (amount >= 0 and new_balance >= self.minimum_balance):
+            raise ValueError("Amount must be non-negative!" if amount < 0
+                             else f"Insufficient funds: Cannot go below minimum balance of ${self.minimum_balance} in a savings account.")
         super().withdraw(amount)
 
     def account_summary(self):
         return f"Savings Account {self.account_number}\n Balance: ${self.balance:.2f}"
 
+    def to_dict(self):
+        data = super().to_dict()
+        data["checkbook_issued"] = "" # Savings account will have missings
+        return data
+
+    def as_row(self):
+        return super().as_row() + ("",)
+
 class CheckingAccount(BankAccount):
     """Checking account with checkbook tracking"""
+    __slots__ = ("checkbook_issued",)
 
     def __init__(self, account_number, first_name, last_name, gender, balance=0.0, transactions=None, checkbook_issued=False):
         super().__init__(account_number, first_name, last_name, gender, "checking", balance, transactions)
@@ -169,20 +307,49 @@ class CheckingAccount(BankAccount):
         data["checkbook_issued"] = self.checkbook_issued
         return data
 
-# ------- CSV Utility Functions  ------- # 
+    def as_row(self):
+        return super().as_row() + (self.checkbook_issued,)
+
+class AccountTable:
+    """Column-oriented view over the accounts for bulk report queries.
+
+    Balances live in one contiguous float array (with parallel lists for
+    the text columns and an account-number -> index dict), so totals and
+    per-type breakdowns are single passes over packed data instead of
+    walks over scattered account objects.
+    """
+    __slots__ = ("account_numbers", "balances", "account_types", "index")
+
+    def __init__(self, accounts):
+        self.account_numbers = []
+        self.balances = array("d")
+        self.account_types = []
+        self.index = {}
+        for acc in accounts.values():
+            self.index[acc.account_number] = len(self.account_numbers)
+            self.account_numbers.append(acc.account_number)
+            self.balances.append(acc.balance)
+            self.account_types.append(acc.account_type)
+
+    def total_balance(self):
+        return sum(self.balances)
+
+    def count_by_type(self):
+        counts = {}
+        for acc_type in self.account_types:
+            counts[acc_type] = counts.get(acc_type, 0) + 1
+        return counts
+
+# ------- CSV Utility Functions  ------- #
 def load_accounts():
     accounts = {}
     try:
         with open(csv_file, newline = '') as file:
             reader = csv.DictReader(file)
             for row in reader:
-                # Parse transactions using from_dict
+                # from_dict already restores the checkbook flag for
+                # checking accounts, so no per-type fix-up is needed here.
                 acc = BankAccount.from_dict(row)
-
-                # Checks whether account is checking then set the checkbook flag
-                if isinstance(acc, CheckingAccount):
-                    acc.checkbook_issued = row.get("checkbook_issued", "False").lower() == "true"
-
                 accounts[acc.account_number] = acc
 
     except FileNotFoundError:
@@ -190,39 +357,120 @@ def load_accounts():
     return accounts
 
 def save_accounts(accounts):
-    with open(csv_file, mode = 'w', newline = '') as file:
-        fieldnames = ["account_number", "first_name", "last_name", "gender",
-                      "account_type", "balance", "transactions", "checkbook_issued"]
-        writer = csv.DictWriter(file, fieldnames = fieldnames)
-        writer.writeheader()
-        for acc in accounts.values():
-            row = acc.to_dict()
-            if isinstance(acc, CheckingAccount):
-                row["checkbook_issued"] = acc.checkbook_issued
-            else:
-                row["checkbook_issued"] = "" # Savings account will have missings
-            writer.writerow(acc.to_dict())
+    # Serialize each account exactly once into one in-memory buffer, then
+    # emit everything with a single write call. as_row yields tuples in
+    # fixed CSV_COLUMNS order, so no per-row dict is built or re-keyed.
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    writer.writerows(acc.as_row() for acc in accounts.values())
+
+    # Write to a sibling temp file and atomically swap it in, so a crash
+    # mid-save can never leave a truncated CSV behind.
+    tmp_file = csv_file + ".tmp"
+    with open(tmp_file, mode = 'w', buffering = 1<<20, newline = '') as file:
+        file.write(buffer.getvalue())
+    os.replace(tmp_file, csv_file)
         
-def generate_account_number(accounts):
-    """Automatically generates the account numbers"""
-    if not accounts:
-        return "00001"
-    
-    existing_numbers = sorted(int(acc_num) for acc_num in accounts.keys())
-    next_number = existing_numbers[-1]+1
-    return f"{next_number:05d}" # pads with zeroes to make it 5 digits
+# ------- Journal Utility Functions  ------- #
+# Instead of rewriting the whole CSV after every mutation, each mutation is
+# appended as one line to a journal file. The full CSV is only rewritten on
+# startup (after replaying the journal) and on exit.
+_journal = None
+
+def _get_journal():
+    global _journal
+    if _journal is None:
+        _journal = open(journal_file, mode = 'a', newline = '')
+        atexit.register(_close_journal)
+    return _journal
+
+def _close_journal():
+    global _journal
+    if _journal is not None:
+        _journal.close()
+        _journal = None
+
+def journal_append(acc_num, op, amount, new_balance):
+    """Appends a single mutation line to the journal and flushes it."""
+    journal = _get_journal()
+    journal.write(f"{acc_num},{op},{amount},{datetime.now().isoformat()},{new_balance}\n")
+    journal.flush()
+
+def replay_journal(accounts):
+    """Re-applies journaled mutations left over from a previous session.
+
+    Hash-join style: build a dict of deltas keyed by account number in one
+    pass over the journal, then probe it with one pass over the accounts —
+    O(accounts + journal lines) however large either side grows.
+    """
+    deltas = defaultdict(list)
+    _float = float
+    _from_iso = datetime.fromisoformat
+    try:
+        with open(journal_file, newline = '') as file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                acc_num, op, amount, timestamp, new_balance = line.split(",")
+                deltas[acc_num].append((op, _float(amount),
+                                        _from_iso(timestamp),
+                                        _float(new_balance)))
+    except FileNotFoundError:
+        return # no journal means the last session exited cleanly.
+
+    for acc_num, acc in accounts.items():
+        for op, amount, date, new_balance in deltas.get(acc_num, ()):
+            acc.apply_delta(op, amount, date, new_balance)
+
+def flush_accounts(accounts):
+    """Rewrites the full CSV and truncates the journal."""
+    save_accounts(accounts)
+    _close_journal()
+    open(journal_file, mode = 'w').close()
+
+def generate_account_number(max_acc_num):
+    """Generates the next account number from the highest issued so far."""
+    return f"{max_acc_num + 1:05d}" # pads with zeroes to make it 5 digits
 
 # ------- Command Line Interface  ------- # 
 def banking_cli():
     accounts = load_accounts()
+
+    # Recover any mutations journaled by a previous session, then start
+    # from a clean checkpoint. A crash mid-session only loses what was
+    # never journaled (nothing), not the whole session.
+    replay_journal(accounts)
+    flush_accounts(accounts)
+    atexit.register(flush_accounts, accounts)
+
+    # Highest issued account number, computed once and bumped on each
+    # create, so generating a number doesn't rescan all accounts.
+    max_acc_num = max((int(acc_num) for acc_num in accounts), default = 0)
+
+    # Mutations only mark the state dirty; a full CSV checkpoint (which
+    # also truncates the journal) runs at most once per save_interval, so
+    # bursts of commands coalesce into one rewrite.
+    dirty = False
+    last_save = time.monotonic()
+
+    def note_mutation():
+        nonlocal dirty, last_save
+        dirty = True
+        if time.monotonic() - last_save > save_interval:
+            flush_accounts(accounts)
+            dirty = False
+            last_save = time.monotonic()
+
     print("Welcome to Sheena's Banking")
-    print("Commands: create, deposit, withdraw, show, exit")
+    print("Commands: create, deposit, withdraw, show, report, exit")
 
     while True:
         cmd = input("\n> ").strip().lower()
 
         if cmd == "create":
-            acc_num = generate_account_number(accounts)
+            acc_num = generate_account_number(max_acc_num)
             print(f"Assigned account number: {acc_num}")
             first = input("First Name: ")
             last = input("Last Name: ")
@@ -238,8 +486,14 @@ def banking_cli():
                 continue
 
             accounts[acc_num] = acc
-            save_accounts(accounts)
-            logging.info(f"Created {acc_type} account {acc_num} for {first} {last}")
+            max_acc_num = int(acc_num)
+            # New rows can't be expressed as a delta against the CSV, so a
+            # create takes a full checkpoint (creates are rare).
+            flush_accounts(accounts)
+            dirty = False
+            last_save = time.monotonic()
+            if log.isEnabledFor(_INFO):
+                log.info("Created %s account %s for %s %s", acc_type, acc_num, first, last)
             print("Account created.")
 
         elif cmd in ("deposit", "withdraw"):
@@ -252,22 +506,26 @@ def banking_cli():
                 amount = float(input("Amount: "))
                 if cmd == "deposit":
                     accounts[acc_num].deposit(amount)
-                    logging.info(f"Deposited ${amount} to account {acc_num}")
+                    if log.isEnabledFor(_INFO):
+                        log.info("Deposited $%s to account %s", amount, acc_num)
                     print("Deposit successful.")
                 else:
                     accounts[acc_num].withdraw(amount)
-                    logging.info(f"Withdrew ${amount} from account {acc_num}")
+                    if log.isEnabledFor(_INFO):
+                        log.info("Withdrew $%s from account %s", amount, acc_num)
                     print("Withdrawal successful.")
-                save_accounts(accounts)
+                journal_append(acc_num, cmd, amount, accounts[acc_num].balance)
+                note_mutation()
             except Exception as e:
-                logging.warning(f"Failed {cmd} on {acc_num}: {e}")
+                log.warning("Failed %s on %s: %s", cmd, acc_num, e)
                 print("Error:", e)
 
         elif cmd == "show":
             acc_num = input("Account number: ")
             if acc_num in accounts:
                 acc = accounts[acc_num]
-                logging.info(f"Viewed account {acc_num}")
+                if log.isEnabledFor(_INFO):
+                    log.info("Viewed account %s", acc_num)
                 print(acc.account_summary())
                 print(acc.get_transaction_history())
 
@@ -276,15 +534,27 @@ def banking_cli():
                     response = input("Checkbook on this Checking Account has not been issued. Issue checkbook? [y/n]: ").strip().lower()
                     if response == "y":
                         acc.issue_checkbook()
-                        save_accounts(accounts)
-                        logging.info(f"Issued checkbook to account {acc_num}")
+                        journal_append(acc_num, "issue_checkbook", 0, acc.balance)
+                        note_mutation()
+                        if log.isEnabledFor(_INFO):
+                            log.info("Issued checkbook to account %s", acc_num)
                     else:
                         print("Account checkbook remains unissued.")
             else:
                 print("Account not found.")
 
+        elif cmd == "report":
+            table = AccountTable(accounts)
+            print(f"Accounts: {len(table.account_numbers)}")
+            for acc_type, count in table.count_by_type().items():
+                print(f"  {acc_type}: {count}")
+            print(f"Total balance: ${table.total_balance():.2f}")
+            log.info("Generated bank-wide report")
+
         elif cmd == "exit":
-            logging.info("User exited the banking system.")
+            if dirty:
+                flush_accounts(accounts)
+            log.info("User exited the banking system.")
             print("Goodbye.")
             break
 